@@ -12,7 +12,6 @@ $ErrorActionPreference = "Stop"
 $ScriptDir = Split-Path -Parent $MyInvocation.MyCommand.Path
 $RepoRoot = Split-Path -Parent $ScriptDir
 $ProtoFile = Join-Path $RepoRoot "proto\fluxgraph.proto"
-$ProtoDir = Join-Path $RepoRoot "proto"
 
 if (-not $OutputDir) {
     if ($env:FLUXGRAPH_PROTO_PYTHON_DIR) {
@@ -51,13 +50,9 @@ if (Test-Path (Join-Path $VenvPath "Scripts\python.exe")) {
     }
 }
 
-# Generate bindings
+# Generate bindings (shared script also writes the .proto_sha256 sentinel)
 Write-Host "`nGenerating bindings..." -ForegroundColor Green
-& $PythonExe -m grpc_tools.protoc `
-    -I $ProtoDir `
-    --python_out=$OutputDir `
-    --grpc_python_out=$OutputDir `
-    $ProtoFile
+& $PythonExe (Join-Path $ScriptDir "generate_python_bindings.py") --output-dir $OutputDir
 
 if ($LASTEXITCODE -ne 0) {
     Write-Host "[ERROR] Code generation failed" -ForegroundColor Red
@@ -9,7 +9,6 @@ set -euo pipefail
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 REPO_ROOT="$(dirname "$SCRIPT_DIR")"
 PROTO_FILE="$REPO_ROOT/proto/fluxgraph.proto"
-PROTO_DIR="$REPO_ROOT/proto"
 
 DEFAULT_OUTPUT_DIR="${FLUXGRAPH_PROTO_PYTHON_DIR:-$REPO_ROOT/build-server/python}"
 OUTPUT_DIR="${1:-$DEFAULT_OUTPUT_DIR}"
@@ -42,14 +41,10 @@ else
     exit 1
 fi
 
-# Generate bindings
+# Generate bindings (shared script also writes the .proto_sha256 sentinel)
 echo ""
 echo "Generating bindings..."
-"$PYTHON_EXE" -m grpc_tools.protoc \
-    -I "$PROTO_DIR" \
-    --python_out="$OUTPUT_DIR" \
-    --grpc_python_out="$OUTPUT_DIR" \
-    "$PROTO_FILE"
+"$PYTHON_EXE" "$SCRIPT_DIR/generate_python_bindings.py" --output-dir "$OUTPUT_DIR"
 
 if [ $? -ne 0 ]; then
     echo "[ERROR] Code generation failed"
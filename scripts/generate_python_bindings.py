@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Generate Python protobuf/gRPC bindings for fluxgraph.proto.
+
+Runs grpc_tools.protoc in-process when available, which skips the Python
+interpreter cold-start and protobuf descriptor re-import that a
+`python -m grpc_tools.protoc` subprocess pays on every call; a subprocess
+fallback remains for environments where grpc_tools is not importable.
+
+After a successful run a .proto_sha256 sentinel holding the hash of the
+proto source is written next to the generated files, so callers (e.g. the
+pytest conftest) can skip regeneration when the proto is unchanged.
+
+Usage examples:
+  python scripts/generate_python_bindings.py
+  python scripts/generate_python_bindings.py --output-dir build-server/python
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import subprocess
+import sys
+from importlib import metadata
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+PROTO_FILE = REPO_ROOT / "proto" / "fluxgraph.proto"
+SENTINEL_NAME = ".proto_sha256"
+
+# Packages whose versions determine the generated code, beyond the proto
+# source itself: gencode from a newer toolchain can refuse to import on an
+# older runtime.
+_TOOLCHAIN_DISTS = ("grpcio-tools", "protobuf")
+
+
+def proto_sha256(proto_file: Path = PROTO_FILE) -> str:
+    """Return the SHA-256 hex digest of the proto source."""
+    return hashlib.sha256(proto_file.read_bytes()).hexdigest()
+
+
+def sentinel_content(proto_file: Path = PROTO_FILE) -> str:
+    """Return the sentinel payload: proto hash plus toolchain versions.
+
+    Including the generator versions means a grpcio-tools/protobuf
+    up- or downgrade invalidates existing bindings exactly like a proto
+    edit would, instead of silently importing mismatched gencode.
+    """
+    versions = []
+    for dist in _TOOLCHAIN_DISTS:
+        try:
+            versions.append(f"{dist}={metadata.version(dist)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{dist}=unknown")
+    return f"{proto_sha256(proto_file)} {' '.join(versions)}\n"
+
+
+def generate_bindings(output_dir: Path, proto_file: Path = PROTO_FILE) -> int:
+    """Generate fluxgraph_pb2/fluxgraph_pb2_grpc modules into output_dir.
+
+    Returns protoc's exit code; on success the hash sentinel is written.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    protoc_args = [
+        f"-I{proto_file.parent}",
+        f"--python_out={output_dir}",
+        f"--grpc_python_out={output_dir}",
+        str(proto_file),
+    ]
+
+    try:
+        from grpc_tools import protoc
+    except ImportError:
+        # Fallback: pay the interpreter cold-start in a subprocess.
+        rc = subprocess.run([sys.executable, "-m", "grpc_tools.protoc", *protoc_args]).returncode
+    else:
+        rc = protoc.main(["grpc_tools.protoc", *protoc_args])
+
+    if rc == 0:
+        (output_dir / SENTINEL_NAME).write_text(sentinel_content(proto_file))
+    return rc
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Generate Python protobuf/gRPC bindings for fluxgraph.proto.")
+    parser.add_argument(
+        "--output-dir",
+        type=Path,
+        default=REPO_ROOT / "build-server" / "python",
+        help="Directory for the generated modules (default: build-server/python)",
+    )
+    args = parser.parse_args()
+
+    if not PROTO_FILE.is_file():
+        print(f"[ERROR] Proto file not found: {PROTO_FILE}", file=sys.stderr)
+        return 1
+
+    rc = generate_bindings(args.output_dir)
+    if rc != 0:
+        print("[ERROR] Code generation failed (install grpcio-tools: pip install grpcio-tools)", file=sys.stderr)
+        return rc
+
+    print(f"[SUCCESS] Generated fluxgraph_pb2.py and fluxgraph_pb2_grpc.py in {args.output_dir}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,14 @@
 #include <sstream>
 #include <string>
 
+#ifdef _WIN32
+#include <process.h>
+#define fluxgraph_getpid _getpid
+#else
+#include <unistd.h>
+#define fluxgraph_getpid getpid
+#endif
+
 // Global server instance for signal handler
 std::unique_ptr<grpc::Server> g_server;
 
@@ -24,9 +32,10 @@ void print_usage(const char *prog_name) {
   std::cout << "FluxGraph gRPC Server\n\n";
   std::cout << "Usage: " << prog_name << " [OPTIONS]\n\n";
   std::cout << "Options:\n";
-  std::cout << "  --port PORT        Server port (default: 50051)\n";
+  std::cout << "  --port PORT        Server port (default: 50051, 0 = auto-select)\n";
   std::cout << "  --config FILE      Preload config file (YAML or JSON)\n";
   std::cout << "  --dt SECONDS       Timestep in seconds (default: 0.1)\n";
+  std::cout << "  --ready-file FILE  Write PID and READY to FILE once serving\n";
   std::cout << "  --help             Show this help message\n";
 }
 
@@ -59,6 +68,7 @@ int main(int argc, char *argv[]) {
   // CLI arguments
   int port = 50051;
   std::string config_path;
+  std::string ready_file_path;
   double dt = 0.1;
 
   // Parse arguments
@@ -85,6 +95,12 @@ int main(int argc, char *argv[]) {
         return 1;
       }
       dt = std::stod(argv[++i]);
+    } else if (arg == "--ready-file") {
+      if (i + 1 >= argc) {
+        std::cerr << "Error: --ready-file requires an argument\n";
+        return 1;
+      }
+      ready_file_path = argv[++i];
     } else {
       std::cerr << "Error: Unknown argument: " << arg << "\n";
       print_usage(argv[0]);
@@ -92,9 +108,9 @@ int main(int argc, char *argv[]) {
     }
   }
 
-  // Validate arguments
-  if (port < 1024 || port > 65535) {
-    std::cerr << "Error: Port must be between 1024 and 65535\n";
+  // Validate arguments (0 lets the kernel pick a free port)
+  if (port != 0 && (port < 1024 || port > 65535)) {
+    std::cerr << "Error: Port must be 0 (auto-select) or between 1024 and 65535\n";
     return 1;
   }
   if (dt <= 0.0) {
@@ -105,7 +121,11 @@ int main(int argc, char *argv[]) {
   std::cout << "=======================================================\n";
   std::cout << "FluxGraph gRPC Server\n";
   std::cout << "=======================================================\n";
-  std::cout << "Port:      " << port << "\n";
+  if (port == 0) {
+    std::cout << "Port:      auto\n";
+  } else {
+    std::cout << "Port:      " << port << "\n";
+  }
   std::cout << "Timestep:  " << dt << " sec (" << (1.0 / dt) << " Hz)\n";
   if (!config_path.empty()) {
     std::cout << "Config:    " << config_path << "\n";
@@ -152,16 +172,37 @@ int main(int argc, char *argv[]) {
     std::string server_address = "0.0.0.0:" + std::to_string(port);
 
     grpc::ServerBuilder builder;
-    builder.AddListeningPort(server_address, grpc::InsecureServerCredentials());
+    int selected_port = 0;
+    builder.AddListeningPort(server_address, grpc::InsecureServerCredentials(),
+                             &selected_port);
     builder.RegisterService(service.get());
 
     g_server = builder.BuildAndStart();
-    if (!g_server) {
+    if (!g_server || selected_port == 0) {
       std::cerr << "[FluxGraph] Failed to start server\n";
       return 1;
     }
 
-    std::cout << "[FluxGraph] Server listening on " << server_address << "\n";
+    std::cout << "[FluxGraph] Server listening on 0.0.0.0:" << selected_port
+              << "\n";
+    // Machine-readable sentinel for harnesses launching with --port 0; the
+    // flush also guarantees the listen socket is bound once this line is
+    // observed.
+    std::cout << "FLUXGRAPH_PORT=" << selected_port << std::endl;
+
+    // Optional file-based readiness notification for supervisors that do
+    // not capture stdout: the file appears only after BuildAndStart, so
+    // the listen socket is bound and all services are registered.
+    if (!ready_file_path.empty()) {
+      std::ofstream ready_file(ready_file_path, std::ios::trunc);
+      if (ready_file.is_open()) {
+        ready_file << fluxgraph_getpid() << " READY " << selected_port << "\n";
+      } else {
+        std::cerr << "[FluxGraph] Warning: could not write ready file: "
+                  << ready_file_path << "\n";
+      }
+    }
+
     std::cout << "[FluxGraph] Press Ctrl+C to stop\n\n";
 
     // Register signal handlers
@@ -1,14 +1,23 @@
+import functools
+import itertools
+import logging
 import os
+import queue
 import subprocess
 import sys
+import threading
 import time
-import socket
+from collections import deque
 from pathlib import Path
-from typing import Any, Iterator, List, Tuple
+from typing import Any, Deque, Iterator, Tuple
 
 import grpc
 import pytest
 
+# Lazy %-formatting via the logger: message construction is skipped entirely
+# unless pytest log capture (or --log-cli-level) enables the level.
+logger = logging.getLogger(__name__)
+
 # Types for type hinting
 
 # -----------------------------------------------------------------------------
@@ -16,11 +25,22 @@ import pytest
 # -----------------------------------------------------------------------------
 
 
+# pytest config.cache keys for paths resolved in earlier sessions.
+_SERVER_EXE_CACHE_KEY = "fluxgraph/server_exe"
+_PROTO_DIR_CACHE_KEY = "fluxgraph/proto_dir"
+
+# Validated hints seeded from config.cache by pytest_configure.
+_server_exe_hint: Path | None = None
+_proto_dir_hint: Path | None = None
+
+
+@functools.lru_cache(maxsize=None)
 def _repo_root() -> Path:
     """Return the repository root directory."""
     return Path(__file__).resolve().parent.parent
 
 
+@functools.lru_cache(maxsize=None)
 def _find_server_executable(root: Path) -> Path:
     """Resolve the fluxgraph-server executable path."""
     # Check environment variable first (set by CMake/CI)
@@ -30,82 +50,106 @@ def _find_server_executable(root: Path) -> Path:
         if path.exists() and path.is_file():
             return path.resolve()
         # Warn but fall back if env var points to nowhere
-        print(f"WARNING: FLUXGRAPH_SERVER_EXE={env_path} does not exist. Falling back to search.")
+        logger.warning("FLUXGRAPH_SERVER_EXE=%s does not exist. Falling back to search.", env_path)
 
-    # Search common build locations
-    names = ["fluxgraph-server.exe", "fluxgraph-server"]
-    build_dirs = [
+    # Path validated against the previous session's cache: skip the search.
+    if _server_exe_hint is not None:
+        return _server_exe_hint
+
+    # Search common build locations. One directory read per level instead of
+    # a stat per candidate path: scan the repo root once for existing build
+    # trees, then scan each surviving candidate directory once.
+    names = ("fluxgraph-server.exe", "fluxgraph-server")
+    build_dirs = (
         "build/server",
         "build/server/Release",
         "build/server/Debug",
         "build-server",
         "build-server/Release",
         "build-server/Debug",
-    ]
+    )
+
+    try:
+        root_entries = {entry.name for entry in os.scandir(root)}
+    except OSError:
+        root_entries = set()
 
     for build_dir in build_dirs:
+        if build_dir.split("/", 1)[0] not in root_entries:
+            continue
+        try:
+            entries = {entry.name: entry for entry in os.scandir(root / build_dir)}
+        except OSError:
+            continue
         for name in names:
-            candidate = root / build_dir / name
-            if candidate.exists() and candidate.is_file():
-                return candidate.resolve()
+            entry = entries.get(name)
+            if entry is not None and entry.is_file():
+                return Path(entry.path).resolve()
 
     pytest.skip("Could not find fluxgraph-server executable. Build the server first.")
     return Path("NOT_FOUND")
 
 
+def _binding_generator(root: Path) -> Any:
+    """Import and return the shared scripts/generate_python_bindings module."""
+    script_dir = str(root / "scripts")
+    if script_dir not in sys.path:
+        sys.path.append(script_dir)
+    import generate_python_bindings
+
+    return generate_python_bindings
+
+
+@functools.lru_cache(maxsize=None)
 def _ensure_proto_bindings(root: Path) -> Path:
-    """Ensure Python protobuf bindings exist and are in sys.path."""
+    """Ensure Python protobuf bindings exist, are current, and are in sys.path.
+
+    Regeneration is gated on a .proto_sha256 sentinel written next to the
+    generated files, covering the hash of proto/fluxgraph.proto and the
+    grpcio-tools/protobuf versions that produced them: when both match, the
+    protoc run is skipped entirely; a proto edit or a toolchain up/downgrade
+    regenerates even though the files exist.
+    """
 
     # Check environment variable (set by CMake/CI)
     env_path = os.environ.get("FLUXGRAPH_PROTO_PYTHON_DIR")
     if env_path:
         python_proto_dir = Path(env_path)
+    elif _proto_dir_hint is not None:
+        # Directory validated against the previous session's cache.
+        python_proto_dir = _proto_dir_hint
     else:
         # Default location
         python_proto_dir = root / "build-server" / "python"
 
     required_files = ("fluxgraph_pb2.py", "fluxgraph_pb2_grpc.py")
+    generator = _binding_generator(root)
+    # Explicit str annotations: the script module imports as Any, and the
+    # comparison below must not leak that into bindings_up_to_date's bool.
+    expected_sentinel: str = generator.sentinel_content()
+    sentinel_name: str = generator.SENTINEL_NAME
 
     def has_required_bindings(path: Path) -> bool:
         return all((path / filename).is_file() for filename in required_files)
 
-    has_bindings = has_required_bindings(python_proto_dir)
+    def bindings_up_to_date(path: Path) -> bool:
+        if not has_required_bindings(path):
+            return False
+        try:
+            return (path / sentinel_name).read_text() == expected_sentinel
+        except OSError:
+            return False
+
+    has_bindings = bindings_up_to_date(python_proto_dir)
 
     if not has_bindings:
-        # Try to generate them using the scripts
-        script_ext = ".ps1" if sys.platform == "win32" else ".sh"
-        script = root / "scripts" / f"generate_proto_python{script_ext}"
-
-        if script.exists():
-            print(f"Generating proto bindings using {script}...")
-            cmd = (
-                [
-                    "powershell",
-                    "-ExecutionPolicy",
-                    "Bypass",
-                    "-File",
-                    str(script),
-                    "-OutputDir",
-                    str(python_proto_dir),
-                ]
-                if sys.platform == "win32"
-                else ["bash", str(script), str(python_proto_dir)]
-            )
-            try:
-                result = subprocess.run(cmd, check=True, capture_output=True, text=True)
-                if result.stdout:
-                    print(result.stdout)
-                if result.stderr:
-                    print(result.stderr)
-            except subprocess.CalledProcessError as e:
-                stdout = e.stdout if isinstance(e.stdout, str) else ""
-                stderr = e.stderr if isinstance(e.stderr, str) else ""
-                pytest.fail(
-                    "Failed to generate protobuf bindings.\n"
-                    f"Command: {' '.join(cmd)}\n"
-                    f"stdout:\n{stdout}\n"
-                    f"stderr:\n{stderr}"
-                )
+        # Generate in-process via the shared script module: no shell wrapper,
+        # no interpreter cold-start. The script writes the sentinel on
+        # success.
+        logger.debug("Generating proto bindings into %s...", python_proto_dir)
+        rc = generator.generate_bindings(python_proto_dir)
+        if rc != 0:
+            pytest.fail(f"Failed to generate protobuf bindings (protoc exit code {rc}).")
 
         has_bindings = has_required_bindings(python_proto_dir)
 
@@ -124,25 +168,135 @@ def _ensure_proto_bindings(root: Path) -> Path:
     return python_proto_dir
 
 
-def _allocate_free_port() -> int:
-    """Allocate a free ephemeral localhost TCP port."""
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-        s.bind(("127.0.0.1", 0))
-        return int(s.getsockname()[1])
+@functools.lru_cache(maxsize=None)
+def _proto_modules() -> Tuple[Any, Any]:
+    """Return (fluxgraph_pb2, fluxgraph_pb2_grpc), imported once per session.
+
+    Requires _ensure_proto_bindings() to have put the generated files on
+    sys.path; pytest_configure does this eagerly so fixtures and tests skip
+    the repeated import machinery.
+    """
+    import fluxgraph_pb2 as pb
+    import fluxgraph_pb2_grpc as pb_grpc
+
+    return pb, pb_grpc
+
+
+def _seed_path_hints(config: pytest.Config) -> None:
+    """Validate cached paths from earlier sessions with a single stat each."""
+    global _server_exe_hint, _proto_dir_hint
+
+    cached_exe = config.cache.get(_SERVER_EXE_CACHE_KEY, None)
+    if cached_exe:
+        try:
+            os.stat(cached_exe)
+            _server_exe_hint = Path(cached_exe)
+        except OSError:
+            config.cache.set(_SERVER_EXE_CACHE_KEY, None)
+
+    cached_proto_dir = config.cache.get(_PROTO_DIR_CACHE_KEY, None)
+    if cached_proto_dir:
+        path = Path(cached_proto_dir)
+        if (path / "fluxgraph_pb2.py").is_file() and (path / "fluxgraph_pb2_grpc.py").is_file():
+            _proto_dir_hint = path
+        else:
+            config.cache.set(_PROTO_DIR_CACHE_KEY, None)
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Resolve proto bindings eagerly, before collection."""
+    _seed_path_hints(config)
+    try:
+        _ensure_proto_bindings(_repo_root())
+    except (pytest.fail.Exception, pytest.skip.Exception) as e:
+        # Don't abort collection: the integration module importorskips the
+        # bindings, so the suite degrades to skips. Surface the cause as a
+        # session warning, otherwise a broken toolchain looks like ten
+        # harmless skips.
+        config.issue_config_time_warning(
+            pytest.PytestConfigWarning(f"Proto bindings unavailable, integration tests will be skipped: {e}"),
+            stacklevel=2,
+        )
+        return
+    _proto_modules()
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: "list[pytest.Item]") -> None:
+    """Group integration tests contiguously to maximize fixture reuse.
+
+    sort() is stable, so relative order within each group is preserved;
+    the integration tests run as one block against the shared session
+    server instead of interleaving with tests that never touch it.
+    """
+    items.sort(key=lambda item: 0 if item.get_closest_marker("integration") else 1)
+
+
+# Emitted by the server once its listen socket is bound (see server/main.cpp).
+_PORT_SENTINEL = b"FLUXGRAPH_PORT="
+
+# Upper bound on retained log lines per stream; old lines are discarded so a
+# chatty server cannot grow test memory without bound.
+_LOG_LINE_LIMIT = 10000
+
+
+def _wait_for_serving(
+    channel: grpc.Channel, stub: Any, process: subprocess.Popen[bytes], timeout_sec: float
+) -> str | None:
+    """Block until `channel` connects and the server reports SERVING.
+
+    Waits on the underlying HTTP/2 handshake via channel_ready_future
+    (resolving the instant the server accepts) instead of spinning on
+    short-deadline Check RPCs. The wait is sliced so a crashed server
+    process is reported promptly rather than after the full timeout.
+
+    Returns None on success, or a short failure description.
+    """
+    pb = _proto_modules()[0]
+
+    # Monotonic integer deadline: immune to wall-clock jumps and cheaper
+    # to compare than repeated CLOCK_REALTIME reads.
+    deadline_ns = time.monotonic_ns() + int(timeout_sec * 1e9)
+    ready_future = grpc.channel_ready_future(channel)
+    while True:
+        if process.poll() is not None:
+            ready_future.cancel()
+            return f"server exited with code {process.returncode}"
+        remaining = (deadline_ns - time.monotonic_ns()) / 1e9
+        if remaining <= 0:
+            ready_future.cancel()
+            return f"channel not ready within {timeout_sec:.1f}s"
+        try:
+            ready_future.result(timeout=min(0.25, remaining))
+            break
+        except grpc.FutureTimeoutError:
+            continue
+
+    try:
+        response = stub.Check(pb.HealthCheckRequest(service="fluxgraph"), timeout=1.0)
+    except grpc.RpcError as e:
+        return f"health check failed: {e.code()}"
+    if response.status != pb.HealthCheckResponse.SERVING:
+        return f"unexpected health status: {response.status}"
+    return None
+
 
+def _collect_process_output(server: "ServerProcess") -> Tuple[str, str]:
+    """Terminate the server if needed and snapshot captured stdout/stderr.
 
-def _collect_process_output(process: subprocess.Popen[str]) -> Tuple[str, str]:
-    """Terminate process if needed and return captured stdout/stderr."""
+    The drain threads own the pipes, so this never blocks on communicate();
+    it just stops the process and copies what has been captured so far.
+    """
+    process = server.process
     if process.poll() is None:
         process.terminate()
         try:
-            stdout, stderr = process.communicate(timeout=2)
+            process.wait(timeout=2)
         except subprocess.TimeoutExpired:
             process.kill()
-            stdout, stderr = process.communicate(timeout=2)
-    else:
-        stdout, stderr = process.communicate()
-    return stdout or "", stderr or ""
+            process.wait(timeout=2)
+    # Give the drain threads a moment to flush the final lines.
+    time.sleep(0.05)
+    return server.stdout_log(), server.stderr_log()
 
 
 # -----------------------------------------------------------------------------
@@ -151,32 +305,77 @@ def _collect_process_output(process: subprocess.Popen[str]) -> Tuple[str, str]:
 
 
 @pytest.fixture(scope="session")
-def proto_bindings() -> Path:
+def proto_bindings(request: pytest.FixtureRequest) -> Path:
     """Ensure protobuf bindings are available for the session."""
-    return _ensure_proto_bindings(_repo_root())
+    path = _ensure_proto_bindings(_repo_root())
+    request.config.cache.set(_PROTO_DIR_CACHE_KEY, str(path))
+    return path
 
 
 @pytest.fixture(scope="session")
-def server_exe() -> Path:
+def server_exe(request: pytest.FixtureRequest) -> Path:
     """Resolve server executable path."""
-    return _find_server_executable(_repo_root())
+    path = _find_server_executable(_repo_root())
+    request.config.cache.set(_SERVER_EXE_CACHE_KEY, str(path))
+    return path
 
 
-@pytest.fixture
-def free_port() -> int:
-    """Get a free ephemeral port."""
-    return _allocate_free_port()
+def _xdist_worker() -> str:
+    """Return the pytest-xdist worker id, or "main" without xdist.
+
+    Session-scoped fixtures are per-worker under xdist, so each worker owns
+    its own server instance; the id tags log/failure output for debugging.
+    """
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
 
 
 class ServerProcess:
-    """Manages a running fluxgraph-server process."""
+    """Manages a running fluxgraph-server process.
 
-    def __init__(self, process: subprocess.Popen[str], port: int) -> None:
+    Daemon reader threads drain stdout/stderr continuously into bounded
+    deques, so the child can never block on a full kernel pipe buffer no
+    matter how much it logs. The stdout drain also watches for the
+    FLUXGRAPH_PORT sentinel that reports the bound port.
+    """
+
+    def __init__(self, process: subprocess.Popen[bytes]) -> None:
         self.process = process
+        self.port: int | None = None
+        self.address = ""
+        self.worker = _xdist_worker()
+        self._stdout_lines: Deque[bytes] = deque(maxlen=_LOG_LINE_LIMIT)
+        self._stderr_lines: Deque[bytes] = deque(maxlen=_LOG_LINE_LIMIT)
+        self._port_queue: queue.Queue[int] = queue.Queue()
+        if process.stdout is not None:
+            threading.Thread(target=self._drain_stdout, daemon=True).start()
+        if process.stderr is not None:
+            threading.Thread(target=self._drain_stderr, daemon=True).start()
+
+    def _drain_stdout(self) -> None:
+        assert self.process.stdout is not None
+        for line in self.process.stdout:
+            self._stdout_lines.append(line)
+            stripped = line.strip()
+            if stripped.startswith(_PORT_SENTINEL):
+                try:
+                    self._port_queue.put(int(stripped[len(_PORT_SENTINEL) :].decode("ascii")))
+                except (UnicodeDecodeError, ValueError):
+                    pass
+
+    def _drain_stderr(self) -> None:
+        assert self.process.stderr is not None
+        for line in self.process.stderr:
+            self._stderr_lines.append(line)
+
+    def wait_for_port(self, timeout_sec: float) -> int | None:
+        """Block until the server reports its bound port, or return None."""
+        try:
+            port = self._port_queue.get(timeout=timeout_sec)
+        except queue.Empty:
+            return None
         self.port = port
         self.address = f"127.0.0.1:{port}"
-        self._stdout_lines: List[str] = []
-        self._stderr_lines: List[str] = []
+        return port
 
     def stop(self) -> None:
         """Terminate the server process."""
@@ -187,105 +386,211 @@ class ServerProcess:
             except subprocess.TimeoutExpired:
                 self.process.kill()
 
+    def stdout_log(self) -> str:
+        """Return stdout captured so far, decoded on demand."""
+        return b"".join(self._stdout_lines).decode("utf-8", errors="replace")
+
+    def stderr_log(self) -> str:
+        """Return stderr captured so far, decoded on demand."""
+        return b"".join(self._stderr_lines).decode("utf-8", errors="replace")
+
     def get_logs(self) -> str:
-        """Return combined stdout/stderr logs."""
-        # Note: In a real implementation with continuous output,
-        # we'd use a background thread to capture output to avoid blocking buffers.
-        # fast implementation for now assuming reasonable log volume for tests.
-        return "Logs capture not fully implemented for non-blocking IO"
+        """Return combined stdout/stderr logs captured so far."""
+        return self.stdout_log() + self.stderr_log()
 
 
-@pytest.fixture
-def fluxgraph_server(server_exe: Path, free_port: int, proto_bindings: Path) -> Iterator[ServerProcess]:
+def _spawn_server(server_exe: Path, extra_args: Tuple[str, ...] = (), timeout_sec: float = 10.0) -> ServerProcess:
+    """Spawn a fluxgraph-server on a kernel-assigned port and return it.
+
+    Raises RuntimeError when the child never reports a listening port.
     """
-    Start a fluxgraph-server instance on a random port.
+    cmd = [str(server_exe), "--port", "0", *extra_args]
+    # Binary pipes: the drain threads store raw bytes and decoding happens
+    # only when logs are actually requested, not per line as text=True would.
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        # No cwd: tests send configs via config_content in-memory, never by
+        # relative path, so the child need not chdir before exec.
+    )
+    server = ServerProcess(proc)
+    if server.wait_for_port(timeout_sec) is None:
+        stdout, stderr = _collect_process_output(server)
+        raise RuntimeError(
+            f"Server did not report a listening port within {timeout_sec:.1f}s "
+            f"(code={proc.returncode}).\n"
+            f"stdout:\n{stdout}\n"
+            f"stderr:\n{stderr}"
+        )
+    return server
+
+
+@pytest.fixture(scope="session")
+def start_server(server_exe: Path, proto_bindings: Path) -> Any:
+    """Factory for dedicated server instances (e.g. custom --dt flags).
+
+    Callers own the returned ServerProcess and must stop() it.
+    """
+
+    def _start(*extra_args: str) -> ServerProcess:
+        return _spawn_server(server_exe, extra_args)
+
+    return _start
+
+
+@pytest.fixture(scope="session")
+def fluxgraph_server(server_exe: Path, proto_bindings: Path) -> Iterator[ServerProcess]:
+    """
+    Start a fluxgraph-server instance on an auto-selected port, shared by
+    the whole session. Per-test isolation is provided by `_reset_state`.
     Yields a ServerProcess object.
-    Autostops after test.
+    Autostops at session end.
     """
-    # Import pb modules dynamically after ensuring bindings exist
-    import fluxgraph_pb2_grpc as pb_grpc
-    import fluxgraph_pb2 as pb
+    pb_grpc = _proto_modules()[1]
 
-    max_start_attempts = 3
     startup_timeout_sec = 10.0
-    startup_failure = "unknown startup failure"
-
-    for attempt in range(1, max_start_attempts + 1):
-        port = free_port if attempt == 1 else _allocate_free_port()
-        cmd = [str(server_exe), "--port", str(port)]
-
-        # Start process
-        proc = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True,
-            cwd=str(_repo_root()),  # Run from repo root so relative config paths work if needed
+
+    # A single attempt suffices: --port 0 auto-selection removed the bind
+    # race that the old 3-attempt retry loop existed to paper over.
+    try:
+        server = _spawn_server(server_exe, timeout_sec=startup_timeout_sec)
+    except RuntimeError as e:
+        pytest.fail(f"[{_xdist_worker()}] Server startup failed: {e}")
+
+    # Wait for readiness: block on the HTTP/2 handshake, then confirm
+    # SERVING with a single health check.
+    channel = _make_channel(server.address)
+    stub = pb_grpc.FluxGraphStub(channel)
+
+    failure_reason = _wait_for_serving(channel, stub, server.process, startup_timeout_sec)
+
+    channel.close()
+
+    if failure_reason is not None:
+        stdout, stderr = _collect_process_output(server)
+        pytest.fail(
+            f"[{server.worker}] Server at {server.address} failed readiness: {failure_reason}\n"
+            f"stdout:\n{stdout}\n"
+            f"stderr:\n{stderr}"
         )
-        server = ServerProcess(proc, port)
-
-        # Wait for readiness (using gRPC health check)
-        channel = grpc.insecure_channel(server.address)
-        stub = pb_grpc.FluxGraphStub(channel)
-
-        start_time = time.time()
-        ready = False
-        last_err: grpc.RpcError | None = None
-
-        while time.time() - start_time < startup_timeout_sec:
-            if proc.poll() is not None:
-                stdout, stderr = _collect_process_output(proc)
-                startup_failure = (
-                    f"Server exited during startup on attempt {attempt}/{max_start_attempts} "
-                    f"(port={port}, code={proc.returncode}).\n"
-                    f"stdout:\n{stdout}\n"
-                    f"stderr:\n{stderr}"
-                )
-                break
 
-            try:
-                req = pb.HealthCheckRequest(service="fluxgraph")
-                resp = stub.Check(req, timeout=0.5)
-                if resp.status == pb.HealthCheckResponse.SERVING:
-                    ready = True
-                    break
-            except grpc.RpcError as e:
-                last_err = e
-                time.sleep(0.1)
+    yield server
+    server.stop()
 
-        channel.close()
 
-        if ready:
-            yield server
-            server.stop()
-            return
+# Session-lived channels: keepalive pings stop idle HTTP/2 connections from
+# being torn down (and transparently re-dialed) mid-suite.
+_CHANNEL_OPTIONS = [
+    ("grpc.keepalive_time_ms", 10000),
+    ("grpc.keepalive_timeout_ms", 5000),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.enable_retries", 1),
+    # Headroom over the 4 MiB default so a large ReadSignals response can
+    # never force a mid-suite channel reconfiguration.
+    ("grpc.max_receive_message_length", 16 * 1024 * 1024),
+]
 
-        if proc.poll() is None:
-            stdout, stderr = _collect_process_output(proc)
-            startup_failure = (
-                f"Server at {server.address} failed readiness on attempt {attempt}/{max_start_attempts} "
-                f"within {startup_timeout_sec:.1f}s. Last RPC error: {last_err}\n"
-                f"stdout:\n{stdout}\n"
-                f"stderr:\n{stderr}"
-            )
 
-        if attempt < max_start_attempts:
-            print(f"WARNING: {startup_failure}\nRetrying startup...")
+def _make_channel(address: str, extra_options: Tuple[Tuple[str, int], ...] = ()) -> grpc.Channel:
+    """Create an insecure channel carrying the suite's standard options."""
+    return grpc.insecure_channel(address, options=[*_CHANNEL_OPTIONS, *extra_options])
 
-    pytest.fail(startup_failure)
+
+class ChannelPool:
+    """Round-robin pool of gRPC channels to a single server address.
+
+    The distinct grpc.use_local_subchannel_pool option value per channel
+    stops gRPC from coalescing them onto one subchannel, so concurrent RPCs
+    spread across several HTTP/2 connections instead of queueing behind a
+    single connection's stream limit and flow-control window.
+    """
+
+    def __init__(self, address: str, size: int = 4) -> None:
+        self._channels = [
+            _make_channel(address, extra_options=(("grpc.use_local_subchannel_pool", i),)) for i in range(size)
+        ]
+        self._counter = itertools.count()
+
+    def stub(self) -> Any:
+        """Return a FluxGraph stub bound to the next channel in the pool."""
+        pb_grpc = _proto_modules()[1]
+        channel = self._channels[next(self._counter) % len(self._channels)]
+        return pb_grpc.FluxGraphStub(channel)
+
+    def close(self) -> None:
+        for channel in self._channels:
+            channel.close()
+
+
+@pytest.fixture(scope="session")
+def channel_pool(fluxgraph_server: ServerProcess, request: pytest.FixtureRequest) -> ChannelPool:
+    """Provide a session-lived channel pool to the shared server."""
+    pool = ChannelPool(fluxgraph_server.address)
+    request.addfinalizer(pool.close)
+    return pool
 
 
 @pytest.fixture
-def grpc_channel(fluxgraph_server: ServerProcess) -> Iterator[grpc.Channel]:
-    """Provide a ready-to-use gRPC channel to the running server."""
-    channel = grpc.insecure_channel(fluxgraph_server.address)
-    yield channel
-    channel.close()
+def grpc_stub(channel_pool: ChannelPool, proto_bindings: Path) -> Any:
+    """Provide a FluxGraph stub, round-robined over the channel pool."""
+    return channel_pool.stub()
+
+
+@pytest.fixture(scope="session")
+def _dt_server(start_server: Any) -> Iterator[Any]:
+    """Start one --dt=0.25 server for the whole session.
+
+    Spawning a server and waiting for readiness costs far more than the
+    RPCs under test, so the process, channel and stub are created once; any
+    test file reaches it through grpc_stub_dt_025, which resets state per
+    test instead of tearing down the process.
+    """
+    pb_grpc = _proto_modules()[1]
+
+    server = start_server("--dt", "0.25")
+
+    channel = _make_channel(server.address)
+    stub = pb_grpc.FluxGraphStub(channel)
+
+    failure_reason = _wait_for_serving(channel, stub, server.process, timeout_sec=10.0)
+    if failure_reason is not None:
+        server.stop()
+        pytest.fail(
+            f"[{server.worker}] Server with --dt=0.25 failed readiness: {failure_reason}\nlogs:\n{server.get_logs()}"
+        )
+
+    try:
+        yield stub
+    finally:
+        channel.close()
+        server.stop()
 
 
 @pytest.fixture
-def grpc_stub(grpc_channel: grpc.Channel, proto_bindings: Path) -> Any:
-    """Provide a FluxGraph stub."""
-    import fluxgraph_pb2_grpc as pb_grpc
+def grpc_stub_dt_025(_dt_server: Any) -> Iterator[Any]:
+    """Hand out the shared --dt=0.25 stub, resetting state after each test."""
+    pb = _proto_modules()[0]
+
+    yield _dt_server
+
+    try:
+        _dt_server.Reset(pb.ResetRequest())
+    except grpc.RpcError as e:
+        if e.code() != grpc.StatusCode.FAILED_PRECONDITION:
+            raise
+
+
+@pytest.fixture(autouse=True)
+def _reset_state(grpc_stub: Any) -> Iterator[None]:
+    """Restore clean simulation state on the shared server between tests."""
+    pb = _proto_modules()[0]
+
+    yield
 
-    return pb_grpc.FluxGraphStub(grpc_channel)
+    try:
+        grpc_stub.Reset(pb.ResetRequest())
+    except grpc.RpcError as e:
+        # Tests that never load a config leave nothing to reset.
+        if e.code() != grpc.StatusCode.FAILED_PRECONDITION:
+            raise
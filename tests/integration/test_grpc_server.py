@@ -1,20 +1,31 @@
 """Integration tests for the FluxGraph gRPC server."""
 
+import asyncio
+import functools
+import itertools
+
 import grpc
 import pytest
-import subprocess
-import time
 from typing import Any, cast
 
+_BASELINE_CONFIG_HASH = "baseline_cfg_v1"
+
+# Unique hashes for config restores; a fresh hash forces a full reload.
+_restore_counter = itertools.count()
 
-def _pb() -> Any:
-    import fluxgraph_pb2 as pb
+# Approximators for accumulated sim time, built once with an explicit
+# tolerance rather than per assertion. Signal values written verbatim by a
+# provider stay exact comparisons.
+_APPROX_QUARTER = pytest.approx(0.25, rel=1e-6)
+_APPROX_HALF = pytest.approx(0.50, rel=1e-6)
 
-    return pb
+# conftest's pytest_configure puts the generated bindings on sys.path before
+# collection; skip the whole module cleanly when they are unavailable.
+pb = pytest.importorskip("fluxgraph_pb2")
+pb_grpc = pytest.importorskip("fluxgraph_pb2_grpc")
 
 
-def _valid_yaml_config() -> str:
-    return """
+_VALID_YAML = """
 models:
   - id: chamber
     type: thermal_mass
@@ -37,92 +48,125 @@ edges:
 """
 
 
-def _load_config(grpc_stub: Any, pb: Any, config_hash: str = "test_config_v1") -> Any:
-    response = grpc_stub.LoadConfig(
-        pb.ConfigRequest(
-            config_content=_valid_yaml_config(),
-            format="yaml",
-            config_hash=config_hash,
-        )
+# Request messages are immutable from the client's point of view, so build
+# each distinct one once instead of paying descriptor-pool construction and
+# field merging on every call.
+@functools.lru_cache(maxsize=None)
+def _config_request(config_hash: str) -> Any:
+    return pb.ConfigRequest(
+        config_content=_VALID_YAML,
+        format="yaml",
+        config_hash=config_hash,
     )
+
+
+@functools.lru_cache(maxsize=None)
+def _provider_registration(provider_id: str) -> Any:
+    return pb.ProviderRegistration(
+        provider_id=provider_id,
+        device_ids=["heater0"],
+    )
+
+
+# Template for the heater.output updates most tests send. CopyFrom is one
+# C++-side message copy instead of a field-setter round-trip per attribute.
+_HEATER_UPDATE_TEMPLATE = pb.SignalUpdates(
+    signals=[pb.SignalUpdate(path="heater.output", value=500.0, unit="W")],
+)
+
+
+def _heater_update(session_id: str, value: float = 500.0) -> Any:
+    request = pb.SignalUpdates()
+    request.CopyFrom(_HEATER_UPDATE_TEMPLATE)
+    request.session_id = session_id
+    request.signals[0].value = value
+    return request
+
+
+def _load_config(grpc_stub: Any, pb: Any, config_hash: str = "test_config_v1") -> Any:
+    response = grpc_stub.LoadConfig(_config_request(config_hash))
     assert response.success
     return response
 
 
 def _register_provider(grpc_stub: Any, pb: Any, provider_id: str = "sim_test") -> str:
-    response = grpc_stub.RegisterProvider(
-        pb.ProviderRegistration(
-            provider_id=provider_id,
-            device_ids=["heater0"],
-        )
-    )
+    response = grpc_stub.RegisterProvider(_provider_registration(provider_id))
     assert response.success
     assert response.session_id
     return cast(str, response.session_id)
 
 
+@pytest.fixture(scope="session")
+def loaded_config(channel_pool: Any) -> None:
+    """Load the baseline YAML config once for the whole session.
+
+    The per-test Reset clears signal state but leaves the loaded config in
+    place, so tests that only read or tick against the baseline piggyback
+    on this single LoadConfig instead of re-parsing YAML server-side.
+    Uses a pool stub directly because this fixture outlives the per-test
+    grpc_stub.
+    """
+    _load_config(channel_pool.stub(), pb, config_hash=_BASELINE_CONFIG_HASH)
+
+
 @pytest.fixture
-def grpc_stub_dt_025(server_exe: Any, free_port: int, proto_bindings: Any) -> Any:
-    """Start a dedicated server instance with --dt=0.25 and return a stub."""
-    import fluxgraph_pb2 as pb
-    import fluxgraph_pb2_grpc as pb_grpc
-
-    address = f"127.0.0.1:{free_port}"
-    proc = subprocess.Popen(
-        [str(server_exe), "--port", str(free_port), "--dt", "0.25"],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-    )
+def restored_config(grpc_stub: Any) -> Any:
+    """Restore the baseline config after a test that reloads or breaks it.
+
+    The unique hash forces a full reload, which also rebuilds the signal
+    namespaces that a failed mid-compile LoadConfig leaves cleared.
+    """
+    yield
+    _load_config(grpc_stub, pb, config_hash=f"restore_{next(_restore_counter)}")
+
+
+def _register_provider_factory(stub: Any) -> Any:
+    """Yield a registering factory, then unregister everything it created.
 
-    channel = grpc.insecure_channel(address)
-    stub = pb_grpc.FluxGraphStub(channel)
+    The server only ticks once every registered session has submitted updates
+    for the current generation, so a session left behind by one test would
+    stall UpdateSignals in every later test now that servers are shared
+    across the session. Unregister whatever the test registered.
+    """
+    session_ids: list[str] = []
 
-    ready = False
-    start = time.time()
-    while time.time() - start < 10.0:
-        if proc.poll() is not None:
-            out, err = proc.communicate(timeout=2)
-            pytest.fail(f"Server exited before readiness check.\nstdout:\n{out}\nstderr:\n{err}")
+    def _register(provider_id: str) -> str:
+        session_id = _register_provider(stub, pb, provider_id=provider_id)
+        session_ids.append(session_id)
+        return session_id
 
+    yield _register
+
+    for session_id in session_ids:
         try:
-            resp = stub.Check(pb.HealthCheckRequest(service="fluxgraph"), timeout=0.5)
-            if resp.status == pb.HealthCheckResponse.SERVING:
-                ready = True
-                break
+            stub.UnregisterProvider(pb.UnregisterRequest(session_id=session_id))
         except grpc.RpcError:
-            time.sleep(0.1)
+            pass  # Session already dropped by a config reload or eviction.
 
-    if not ready:
-        proc.terminate()
-        out, err = proc.communicate(timeout=2)
-        pytest.fail(f"Server failed readiness with --dt=0.25.\nstdout:\n{out}\nstderr:\n{err}")
 
-    try:
-        yield stub
-    finally:
-        channel.close()
-        if proc.poll() is None:
-            proc.terminate()
-            try:
-                proc.wait(timeout=2)
-            except subprocess.TimeoutExpired:
-                proc.kill()
+@pytest.fixture
+def register_provider(grpc_stub: Any) -> Any:
+    """Provider-registration factory against the default server."""
+    yield from _register_provider_factory(grpc_stub)
+
+
+@pytest.fixture
+def register_provider_dt(grpc_stub_dt_025: Any) -> Any:
+    """Provider-registration factory against the --dt=0.25 server."""
+    yield from _register_provider_factory(grpc_stub_dt_025)
 
 
 @pytest.mark.integration
 @pytest.mark.slow
 def test_server_health_check(grpc_stub: Any) -> None:
     """Verify server reports healthy status."""
-    pb = _pb()
     response = grpc_stub.Check(pb.HealthCheckRequest(service="fluxgraph"))
     assert response.status == pb.HealthCheckResponse.SERVING
 
 
 @pytest.mark.integration
-def test_load_yaml_config(grpc_stub: Any) -> None:
+def test_load_yaml_config(grpc_stub: Any, restored_config: Any) -> None:
     """Verify valid config loads and hash-based no-op works."""
-    pb = _pb()
     first = _load_config(grpc_stub, pb, config_hash="cfg_hash_1")
     assert first.config_changed
 
@@ -131,17 +175,20 @@ def test_load_yaml_config(grpc_stub: Any) -> None:
 
 
 @pytest.mark.integration
-def test_provider_registration(grpc_stub: Any) -> None:
+def test_provider_registration(
+    grpc_stub: Any, loaded_config: Any, register_provider: Any, request: pytest.FixtureRequest
+) -> None:
     """Verify provider registration succeeds and rejects duplicate provider_id."""
-    pb = _pb()
-    _load_config(grpc_stub, pb)
 
-    _register_provider(grpc_stub, pb, provider_id="provider_a")
+    # Unique per test so registrations persisting on the shared server
+    # cannot collide across tests.
+    provider_id = f"provider_{request.node.name}"
+    register_provider(provider_id)
 
     with pytest.raises(grpc.RpcError) as exc_info:
         grpc_stub.RegisterProvider(
             pb.ProviderRegistration(
-                provider_id="provider_a",
+                provider_id=provider_id,
                 device_ids=["heater1"],
             )
         )
@@ -149,38 +196,28 @@ def test_provider_registration(grpc_stub: Any) -> None:
 
 
 @pytest.mark.integration
-def test_signal_lifecycle(grpc_stub: Any) -> None:
-    """Load config, register provider, update input signal, and read it back."""
-    pb = _pb()
-    _load_config(grpc_stub, pb)
-    session_id = _register_provider(grpc_stub, pb, provider_id="provider_signal")
+def test_signal_lifecycle(grpc_stub: Any, loaded_config: Any, register_provider: Any) -> None:
+    """Register provider, update input signal, and read it back."""
+    session_id = register_provider("provider_signal")
 
-    tick = grpc_stub.UpdateSignals(
-        pb.SignalUpdates(
-            session_id=session_id,
-            signals=[
-                pb.SignalUpdate(
-                    path="heater.output",
-                    value=500.0,
-                    unit="W",
-                )
-            ],
-        )
-    )
+    tick = grpc_stub.UpdateSignals(_heater_update(session_id))
     assert tick.tick_occurred
     assert tick.sim_time_sec > 0.0
 
+    # Not batchable: the read must observe the tick the update triggered,
+    # so these two RPCs are ordering-sensitive.
     read = grpc_stub.ReadSignals(pb.SignalRequest(paths=["heater.output"]))
     assert len(read.signals) == 1
     assert read.signals[0].path == "heater.output"
-    assert read.signals[0].value == pytest.approx(500.0)
+    # Exact in IEEE-754 and written verbatim by the provider, so the
+    # round-trip must be bit-exact - no approx tolerance needed.
+    assert read.signals[0].value == 500.0
     assert read.signals[0].unit == "W"
 
 
 @pytest.mark.integration
 def test_invalid_config_handling(grpc_stub: Any) -> None:
     """Verify malformed YAML is rejected with INVALID_ARGUMENT."""
-    pb = _pb()
     bad_config = "models: ["
 
     with pytest.raises(grpc.RpcError) as exc_info:
@@ -190,87 +227,121 @@ def test_invalid_config_handling(grpc_stub: Any) -> None:
 
 
 @pytest.mark.integration
-def test_reset_functionality(grpc_stub: Any) -> None:
+@pytest.mark.xdist_group(name="stateful")
+def test_reset_functionality(grpc_stub: Any, loaded_config: Any, register_provider: Any) -> None:
     """Verify reset succeeds and clears written signal state."""
-    pb = _pb()
-    _load_config(grpc_stub, pb)
-    session_id = _register_provider(grpc_stub, pb, provider_id="provider_reset")
+    session_id = register_provider("provider_reset")
 
-    grpc_stub.UpdateSignals(
-        pb.SignalUpdates(
-            session_id=session_id,
-            signals=[pb.SignalUpdate(path="heater.output", value=321.0, unit="W")],
-        )
-    )
+    # Not batchable: each step asserts on state the previous RPC produced
+    # (write, observe, reset, observe), so the chain stays sequential.
+    grpc_stub.UpdateSignals(_heater_update(session_id, value=321.0))
 
     before_reset = grpc_stub.ReadSignals(pb.SignalRequest(paths=["heater.output"]))
     assert len(before_reset.signals) == 1
-    assert before_reset.signals[0].value == pytest.approx(321.0)
+    assert before_reset.signals[0].value == 321.0
 
     reset = grpc_stub.Reset(pb.ResetRequest())
     assert reset.success
 
     after_reset = grpc_stub.ReadSignals(pb.SignalRequest(paths=["heater.output"]))
     assert len(after_reset.signals) == 1
-    assert after_reset.signals[0].value == pytest.approx(0.0)
+    assert after_reset.signals[0].value == 0.0
 
 
 @pytest.mark.integration
-def test_reject_protected_signal_writes(grpc_stub: Any) -> None:
+@pytest.mark.xdist_group(name="stateful")
+def test_reject_protected_signal_writes(grpc_stub: Any, loaded_config: Any, register_provider: Any) -> None:
     """Providers cannot write to model-owned or derived target signals."""
-    pb = _pb()
-    _load_config(grpc_stub, pb)
-    session_id = _register_provider(grpc_stub, pb, provider_id="provider_protected")
-
-    with pytest.raises(grpc.RpcError) as physics_exc:
-        grpc_stub.UpdateSignals(
-            pb.SignalUpdates(
-                session_id=session_id,
-                signals=[pb.SignalUpdate(path="chamber.temp", value=99.0, unit="degC")],
-            )
+    session_id = register_provider("provider_protected")
+
+    # The two denied writes are independent (each is rejected before any
+    # tick bookkeeping), so put both RPCs in flight and overlap the
+    # round-trips instead of paying them sequentially.
+    physics_future = grpc_stub.UpdateSignals.future(
+        pb.SignalUpdates(
+            session_id=session_id,
+            signals=[pb.SignalUpdate(path="chamber.temp", value=99.0, unit="degC")],
         )
-    assert physics_exc.value.code() == grpc.StatusCode.PERMISSION_DENIED
+    )
+    derived_future = grpc_stub.UpdateSignals.future(
+        pb.SignalUpdates(
+            session_id=session_id,
+            signals=[pb.SignalUpdate(path="chamber.power", value=99.0, unit="W")],
+        )
+    )
 
-    with pytest.raises(grpc.RpcError) as derived_exc:
-        grpc_stub.UpdateSignals(
-            pb.SignalUpdates(
-                session_id=session_id,
-                signals=[pb.SignalUpdate(path="chamber.power", value=99.0, unit="W")],
+    physics_exc = physics_future.exception()
+    assert isinstance(physics_exc, grpc.RpcError)
+    assert physics_exc.code() == grpc.StatusCode.PERMISSION_DENIED
+
+    derived_exc = derived_future.exception()
+    assert isinstance(derived_exc, grpc.RpcError)
+    assert derived_exc.code() == grpc.StatusCode.PERMISSION_DENIED
+
+
+@pytest.mark.integration
+@pytest.mark.xdist_group(name="stateful")
+def test_multi_provider_coordination(grpc_stub: Any, loaded_config: Any, fluxgraph_server: Any) -> None:
+    """A tick completes only once every registered provider has submitted.
+
+    The two UpdateSignals calls go out concurrently over the asyncio API:
+    issued sequentially from one thread, the first provider would block
+    server-side waiting for the second, which never gets sent.
+    """
+    reg_a = grpc_stub.RegisterProvider(
+        pb.ProviderRegistration(provider_id="provider_coord_a", device_ids=["coord_dev_a"])
+    )
+    reg_b = grpc_stub.RegisterProvider(
+        pb.ProviderRegistration(provider_id="provider_coord_b", device_ids=["coord_dev_b"])
+    )
+    assert reg_a.success and reg_b.success
+
+    async def _submit_both() -> Any:
+        async with grpc.aio.insecure_channel(fluxgraph_server.address) as channel:
+            stub = pb_grpc.FluxGraphStub(channel)
+            return await asyncio.gather(
+                stub.UpdateSignals(_heater_update(reg_a.session_id, value=250.0)),
+                # An empty update still marks this provider's generation.
+                stub.UpdateSignals(pb.SignalUpdates(session_id=reg_b.session_id)),
             )
-        )
-    assert derived_exc.value.code() == grpc.StatusCode.PERMISSION_DENIED
+
+    try:
+        tick_a, tick_b = asyncio.run(_submit_both())
+    finally:
+        for session_id in (reg_a.session_id, reg_b.session_id):
+            try:
+                grpc_stub.UnregisterProvider(pb.UnregisterRequest(session_id=session_id))
+            except grpc.RpcError:
+                pass
+
+    # Both calls observe the same completed tick, regardless of which
+    # provider arrived last.
+    assert tick_a.tick_occurred
+    assert tick_b.tick_occurred
+    assert tick_a.sim_time_sec == tick_b.sim_time_sec
+    assert tick_a.sim_time_sec > 0.0
 
 
 @pytest.mark.integration
-def test_dt_flag_controls_runtime_timestep(grpc_stub_dt_025: Any) -> None:
+def test_dt_flag_controls_runtime_timestep(grpc_stub_dt_025: Any, register_provider_dt: Any) -> None:
     """Server --dt must control simulated time progression."""
-    pb = _pb()
     _load_config(grpc_stub_dt_025, pb, config_hash="cfg_dt_025")
-    session_id = _register_provider(grpc_stub_dt_025, pb, provider_id="provider_dt")
+    session_id = register_provider_dt("provider_dt")
 
-    tick1 = grpc_stub_dt_025.UpdateSignals(
-        pb.SignalUpdates(
-            session_id=session_id,
-            signals=[pb.SignalUpdate(path="heater.output", value=100.0, unit="W")],
-        )
-    )
+    update = _heater_update(session_id, value=100.0)
+
+    tick1 = grpc_stub_dt_025.UpdateSignals(update)
     assert tick1.tick_occurred
-    assert tick1.sim_time_sec == pytest.approx(0.25)
+    assert tick1.sim_time_sec == _APPROX_QUARTER
 
-    tick2 = grpc_stub_dt_025.UpdateSignals(
-        pb.SignalUpdates(
-            session_id=session_id,
-            signals=[pb.SignalUpdate(path="heater.output", value=100.0, unit="W")],
-        )
-    )
+    tick2 = grpc_stub_dt_025.UpdateSignals(update)
     assert tick2.tick_occurred
-    assert tick2.sim_time_sec == pytest.approx(0.50)
+    assert tick2.sim_time_sec == _APPROX_HALF
 
 
 @pytest.mark.integration
-def test_stability_validation_rejects_unsafe_dt(grpc_stub: Any) -> None:
+def test_stability_validation_rejects_unsafe_dt(grpc_stub: Any, restored_config: Any) -> None:
     """LoadConfig should fail when model stability limit is below runtime dt."""
-    pb = _pb()
     unstable_yaml = """
 models:
   - id: unstable